@@ -1,5 +1,4 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
 import numpy as np
 
 class SensorDeployment(ABC):
@@ -10,10 +9,29 @@ class SensorDeployment(ABC):
         self.num_sensors = num_sensors
         self.sensor_radius = sensor_radius
 
+    @staticmethod
+    def _prev_mask(shape, prev_positions=None) -> np.ndarray:
+        """
+        Boolean map of the given shape that is True at every previously deployed sensor position.
+        """
+        prev_mask = np.zeros(shape, dtype=bool)
+        if prev_positions is not None and len(prev_positions):
+            pr, pc = np.asarray(prev_positions).T
+            prev_mask[pr, pc] = True
+        return prev_mask
+
     @abstractmethod
-    def place_sensors(self, fire_map: np.ndarray, bp_map: np.ndarray, time_step: int, prev_positions=None) -> List[Tuple[int, int]]:
+    def place_sensors(self, fire_map: np.ndarray, bp_map: np.ndarray, time_step: int, prev_positions=None) -> np.ndarray:
         """
         Determines sensor positions for the given time step.
         Uses both the fire_map and the burn probability (bp) map to guide placement.
+        Returns an int32 array of shape (num_placed, 2) holding (row, col) positions.
+        """
+        pass
+
+    def close(self) -> None:
+        """
+        Releases any resources held by the algorithm (e.g. worker processes).
+        The default has nothing to release.
         """
         pass
@@ -1,8 +1,163 @@
 from .base_deployment import SensorDeployment
-from typing import List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
+import multiprocessing
 import numpy as np
-import random
-import math
+
+# Upper bound on sensor-pair distances held in memory at once while scoring a population.
+FITNESS_CHUNK_PAIRS = 1 << 20
+
+
+def _random_positions(rng: np.random.Generator, shape: Tuple[int, ...], rows: int, cols: int) -> np.ndarray:
+    """
+    Draw random (row, col) grid positions as an int32 array of shape shape + (2,).
+    """
+    positions = np.empty(shape + (2,), dtype=np.int32)
+    positions[..., 0] = rng.integers(0, rows, size=shape)
+    positions[..., 1] = rng.integers(0, cols, size=shape)
+    return positions
+
+
+@lru_cache(maxsize=None)
+def _make_fitness(num_sensors: int, radius: float) -> Callable[[np.ndarray, np.ndarray], np.ndarray]:
+    """
+    Build a batched fitness function specialized for a fixed sensor count and radius.
+    The sensor pair indices are computed once here and baked into the returned function,
+    which is cached so every call with the same parameters shares it.
+    """
+    pair_i, pair_j = np.triu_indices(num_sensors, k=1)
+    radius_sq = radius * radius
+    # Candidates scored per chunk, so large populations keep a bounded working set.
+    chunk = max(1, FITNESS_CHUNK_PAIRS // max(1, len(pair_i)))
+
+    def fitness_batch(pop: np.ndarray, value_map: np.ndarray) -> np.ndarray:
+        """
+        Evaluate every candidate of a (population_size, num_sensors, 2) population at once.
+        value_map holds the precomputed per-cell value alpha * bp_map + beta * fire_map.
+        Returns a (population_size,) array of fitness values.
+        """
+        # Higher value in areas with higher burn probability and fire intensity.
+        fitness = value_map[pop[..., 0], pop[..., 1]].sum(axis=1, dtype=np.float64)
+        # Penalize pairs of sensors that are too close (each pair counted once).
+        for start in range(0, len(pop), chunk):
+            block = pop[start:start + chunk]
+            diff = block[:, pair_i, :] - block[:, pair_j, :]
+            dist_sq = (diff * diff).sum(-1)
+            close = dist_sq < radius_sq
+            # Only the (usually few) close pairs need an actual distance.
+            shortfall = np.zeros(dist_sq.shape)
+            shortfall[close] = radius - np.sqrt(dist_sq[close])
+            fitness[start:start + chunk] -= shortfall.sum(axis=1)
+        return fitness
+
+    return fitness_batch
+
+
+def _tournament_select(fits: np.ndarray, num_winners: int, rng: np.random.Generator,
+                       tournament_size: int = 3) -> np.ndarray:
+    """
+    Run num_winners independent tournaments and return the indices of the winners.
+    """
+    entrants = rng.integers(0, fits.shape[0], size=(num_winners, tournament_size))
+    return entrants[np.arange(num_winners), fits[entrants].argmax(axis=1)]
+
+
+def _crossover_mutate(pop: np.ndarray, parents: np.ndarray, rows: int, cols: int,
+                      mutation_rate: float, rng: np.random.Generator) -> None:
+    """
+    Breed one child per selected parent index into the tail of pop, in-place.
+
+    Consecutive parents are paired (wrapping around), each pair yields two children by
+    single-point crossover, duplicate positions within a child are replaced by random
+    cells, and every sensor is then re-drawn with probability mutation_rate.
+    """
+    num_children = parents.shape[0]
+    num_sensors = pop.shape[1]
+    selected = pop[parents]
+    first = selected[0::2]
+    second = selected[(np.arange(0, num_children, 2) + 1) % num_children]
+    # Interleave (p1, p2) and (p2, p1) so children come out in pair order.
+    heads = np.stack([first, second], axis=1).reshape(-1, num_sensors, 2)[:num_children]
+    tails = np.stack([second, first], axis=1).reshape(-1, num_sensors, 2)[:num_children]
+
+    # Single-point crossover.
+    points = rng.integers(1, num_sensors, size=num_children)
+    from_head = np.arange(num_sensors)[None, :] < points[:, None]
+    children = np.where(from_head[..., None], heads, tails)
+
+    # Remove duplicates: if a position appears twice, replace the later one with a random position.
+    flat = children[..., 0] * cols + children[..., 1]
+    duplicate = np.triu(flat[:, :, None] == flat[:, None, :], k=1).any(axis=1)
+    children[duplicate] = _random_positions(rng, (int(duplicate.sum()),), rows, cols)
+
+    # Mutation.
+    mutated = rng.random((num_children, num_sensors)) < mutation_rate
+    children[mutated] = _random_positions(rng, (int(mutated.sum()),), rows, cols)
+    pop[pop.shape[0] - num_children:] = children
+
+
+def _evolve(value_map: np.ndarray, num_sensors: int, radius: float, population_size: int,
+            num_generations: int, mutation_rate: float, rng: np.random.Generator) -> Optional[np.ndarray]:
+    """
+    Run the genetic algorithm on a single population and return the best candidate found
+    as a (num_sensors, 2) array, or None if no generation was evaluated.
+    """
+    rows, cols = value_map.shape
+    fitness_batch = _make_fitness(num_sensors, radius)
+    # Initialize population with random candidates: (population_size, num_sensors, 2) positions.
+    population = _random_positions(rng, (population_size, num_sensors), rows, cols)
+    best_candidate = None
+    best_fitness = -float('inf')
+    # Number of top candidates carried over unchanged to the next generation (elitism).
+    num_elites = max(1, population_size // 10)
+    population_fitness = np.empty(population_size)
+    # Leading slots whose fitness is already known (the elites of the previous generation).
+    num_scored = 0
+
+    # Evolve population over a number of generations.
+    for _ in range(num_generations):
+        # Evaluate fitness in one batch, skipping the unchanged elites.
+        population_fitness[num_scored:] = fitness_batch(population[num_scored:], value_map)
+
+        # Keep the elites verbatim in the first slots of the next generation.
+        elite_idx = np.argpartition(-population_fitness, num_elites - 1)[:num_elites]
+        elites = population[elite_idx]
+        elite_fitness = population_fitness[elite_idx]
+
+        # The generation's best candidate is its top elite; no extra pass over the population.
+        top = int(elite_fitness.argmax())
+        if elite_fitness[top] > best_fitness:
+            best_fitness = elite_fitness[top]
+            best_candidate = elites[top]
+
+        # Selection (tournament), then crossover and mutation fill the remaining slots.
+        parents = _tournament_select(population_fitness, population_size - num_elites, rng)
+        _crossover_mutate(population, parents, rows, cols, mutation_rate, rng)
+        population[:num_elites] = elites
+        population_fitness[:num_elites] = elite_fitness
+        num_scored = num_elites
+
+    return best_candidate
+
+
+def _run_island(shm_name: str, shape: Tuple[int, int], dtype: str, num_sensors: int, radius: float,
+                population_size: int, num_generations: int, mutation_rate: float,
+                seed: int) -> Optional[np.ndarray]:
+    """
+    Worker entry point for one island: evolve against the value map held in shared memory.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    value_map = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    try:
+        return _evolve(value_map, num_sensors, radius, population_size, num_generations,
+                       mutation_rate, np.random.default_rng(seed))
+    finally:
+        # Release the view before closing, the buffer cannot be closed while exported.
+        del value_map
+        shm.close()
+
 
 class GeneticDeployment(SensorDeployment):
     """
@@ -11,7 +166,8 @@ class GeneticDeployment(SensorDeployment):
     This algorithm uses a genetic algorithm to optimize sensor positions on a grid.
     The fitness function is computed as a weighted sum of the burn probability and fire
     intensity values at the sensor positions, minus a penalty for any pair of sensors that
-    are closer than the sensor_radius.
+    are closer than the sensor_radius. The best tenth of each generation (at least one
+    candidate) is carried over unchanged to the next.
     """
     def __init__(self, 
                  num_sensors: int, 
@@ -20,7 +176,9 @@ class GeneticDeployment(SensorDeployment):
                  num_generations: int = 100,
                  mutation_rate: float = 0.1, 
                  alpha: float = 0.5, 
-                 beta: float = 0.5):
+                 beta: float = 0.5,
+                 num_islands: int = 1,
+                 seed: Optional[int] = None):
         """
         :param num_sensors: Number of sensors to deploy.
         :param sensor_radius: Minimum separation radius between sensors.
@@ -29,6 +187,10 @@ class GeneticDeployment(SensorDeployment):
         :param mutation_rate: Probability of mutation per sensor in a candidate.
         :param alpha: Weight for the burn probability in fitness evaluation.
         :param beta: Weight for the fire intensity in fitness evaluation.
+        :param num_islands: Number of independent populations evolved in parallel worker
+                            processes, each of size population_size // num_islands.
+                            The best candidate across islands is returned.
+        :param seed: Seed for the random number generator (None for a fresh, unseeded run).
         """
         self.num_sensors = num_sensors
         self.sensor_radius = sensor_radius
@@ -37,98 +199,63 @@ class GeneticDeployment(SensorDeployment):
         self.mutation_rate = mutation_rate
         self.alpha = alpha
         self.beta = beta
+        self.num_islands = num_islands
+        self.rng = np.random.default_rng(seed)
+        self._executor = None
+        self._fitness_kernel = _make_fitness(num_sensors, sensor_radius)
 
-    def place_sensors(self, fire_map: np.ndarray, bp_map: np.ndarray, time_step: int, prev_positions=None) -> List[Tuple[int, int]]:
-        rows, cols = bp_map.shape
-
-        def random_candidate():
-            # Generate a candidate solution: a list of sensor positions (row, col)
-            candidate = []
-            for _ in range(self.num_sensors):
-                r = random.randint(0, rows - 1)
-                c = random.randint(0, cols - 1)
-                candidate.append((r, c))
-            return candidate
-
-        def fitness(candidate):
-            # Compute fitness as the weighted sum of sensor values minus penalties for closeness.
-            value = 0.0
-            penalty = 0.0
-            for (r, c) in candidate:
-                # Higher value in areas with higher burn probability and fire intensity.
-                value += self.alpha * bp_map[r, c] + self.beta * fire_map[r, c]
-            # Penalize pairs of sensors that are too close.
-            for i in range(len(candidate)):
-                for j in range(i+1, len(candidate)):
-                    r1, c1 = candidate[i]
-                    r2, c2 = candidate[j]
-                    dist = math.sqrt((r1 - r2)**2 + (c1 - c2)**2)
-                    if dist < self.sensor_radius:
-                        penalty += (self.sensor_radius - dist)
-            return value - penalty
-
-        def crossover(parent1, parent2):
-            # Single-point crossover between two parent candidates.
-            point = random.randint(1, self.num_sensors - 1)
-            child = parent1[:point] + parent2[point:]
-            # Remove duplicates: if a position appears twice, replace it with a random position.
-            unique_child = []
-            for pos in child:
-                if pos not in unique_child:
-                    unique_child.append(pos)
-                else:
-                    r = random.randint(0, rows - 1)
-                    c = random.randint(0, cols - 1)
-                    unique_child.append((r, c))
-            # Ensure the candidate has exactly num_sensors positions.
-            while len(unique_child) < self.num_sensors:
-                r = random.randint(0, rows - 1)
-                c = random.randint(0, cols - 1)
-                if (r, c) not in unique_child:
-                    unique_child.append((r, c))
-            return unique_child[:self.num_sensors]
-
-        def mutate(candidate):
-            # Mutate candidate by randomly changing sensor positions with probability mutation_rate.
-            new_candidate = candidate.copy()
-            for i in range(self.num_sensors):
-                if random.random() < self.mutation_rate:
-                    new_candidate[i] = (random.randint(0, rows - 1), random.randint(0, cols - 1))
-            return new_candidate
-
-        # Initialize population with random candidates.
-        population = [random_candidate() for _ in range(self.population_size)]
-        best_candidate = None
-        best_fitness = -float('inf')
-
-        # Evolve population over a number of generations.
-        for _ in range(self.num_generations):
-            # Evaluate fitness for each candidate.
-            population_fitness = [fitness(candidate) for candidate in population]
-
-            # Update the best candidate found so far.
-            for candidate, fit in zip(population, population_fitness):
-                if fit > best_fitness:
-                    best_fitness = fit
-                    best_candidate = candidate
-
-            # Selection: tournament selection.
-            new_population = []
-            while len(new_population) < self.population_size:
-                tournament = random.sample(population, 3)
-                tournament_fitness = [fitness(candidate) for candidate in tournament]
-                winner = tournament[tournament_fitness.index(max(tournament_fitness))]
-                new_population.append(winner)
-            # Crossover and mutation to form the next generation.
-            next_population = []
-            for i in range(0, self.population_size, 2):
-                parent1 = new_population[i]
-                parent2 = new_population[(i+1) % self.population_size]
-                child1 = crossover(parent1, parent2)
-                child2 = crossover(parent2, parent1)
-                child1 = mutate(child1)
-                child2 = mutate(child2)
-                next_population.extend([child1, child2])
-            population = next_population[:self.population_size]
+    def place_sensors(self, fire_map: np.ndarray, bp_map: np.ndarray, time_step: int, prev_positions=None) -> np.ndarray:
+        # Per-cell sensor value, computed once per call instead of per candidate.
+        self._value = np.ascontiguousarray(self.alpha * bp_map + self.beta * fire_map, dtype=np.float32)
 
+        if self.num_islands <= 1:
+            best_candidate = _evolve(self._value, self.num_sensors, self.sensor_radius, self.population_size,
+                                     self.num_generations, self.mutation_rate, self.rng)
+        else:
+            best_candidate = self._run_islands()
+
+        if best_candidate is None:
+            return np.empty((0, 2), dtype=np.int32)
         return best_candidate
+
+    def close(self) -> None:
+        """
+        Shuts down the island worker processes, if any were started.
+        """
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _run_islands(self) -> Optional[np.ndarray]:
+        """
+        Evolve num_islands independent populations in worker processes and return the
+        best of their champions. The value map is shared with the workers rather than
+        pickled for every island.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.num_islands,
+                                                 mp_context=multiprocessing.get_context("spawn"))
+        island_size = max(1, self.population_size // self.num_islands)
+        # Each island gets its own seed drawn from this instance's generator.
+        seeds = self.rng.integers(2**63, size=self.num_islands)
+
+        shm = shared_memory.SharedMemory(create=True, size=self._value.nbytes)
+        try:
+            np.ndarray(self._value.shape, dtype=self._value.dtype, buffer=shm.buf)[...] = self._value
+            futures = [
+                self._executor.submit(_run_island, shm.name, self._value.shape, self._value.dtype.str,
+                                      self.num_sensors, self.sensor_radius, island_size,
+                                      self.num_generations, self.mutation_rate, int(seed))
+                for seed in seeds
+            ]
+            champions = [f.result() for f in futures]
+        finally:
+            shm.close()
+            shm.unlink()
+
+        champions = [c for c in champions if c is not None]
+        if not champions:
+            return None
+        # Re-score the island champions on the driver and keep the best one.
+        champions = np.stack(champions)
+        return champions[int(self._fitness_kernel(champions, self._value).argmax())]
@@ -1,5 +1,4 @@
 from .base_deployment import SensorDeployment
-from typing import List, Tuple
 import numpy as np
 
 class GreedyDeployment(SensorDeployment):
@@ -10,44 +9,54 @@ class GreedyDeployment(SensorDeployment):
       - A penalty for any candidate that was selected in the previous time step,
         so that even if the BP value is high, that cell's effective score is reduced.
       - A repulsive mechanism: once a sensor is selected, candidates within a minimum
-        separation distance are penalized (their effective BP is set to 0).
+        separation distance are excluded from further selection.
     """
-    def place_sensors(self, fire_map: np.ndarray, bp_map: np.ndarray, time_step: int, prev_positions=None) -> List[Tuple[int, int]]:
+    def place_sensors(self, fire_map: np.ndarray, bp_map: np.ndarray, time_step: int, prev_positions=None) -> np.ndarray:
         rows, cols = bp_map.shape
-        candidates = []
-        for r in range(rows):
-            for c in range(cols):
-                bp_val = bp_map[r, c]
-                # If a sensor was located at this cell in the previous time step,
-                # apply a penalty (reduce effective BP by 90%).
-                if prev_positions and (r, c) in prev_positions:
-                    effective_bp = bp_val * 0.1
-                else:
-                    effective_bp = bp_val
-                candidates.append(((r, c), effective_bp))
-        
-        # Sort candidates by effective BP (highest first)
-        candidates.sort(key=lambda x: x[1], reverse=True)
-        
-        selected = []
+        # If a sensor was located at a cell in the previous time step,
+        # apply a penalty (reduce effective BP by 90%).
+        prev_mask = self._prev_mask((rows, cols), prev_positions)
+        effective_bp = np.where(prev_mask, bp_map * 0.1, bp_map)
+
+        selected = np.empty((self.num_sensors, 2), dtype=np.int32)
+        num_selected = 0
         # Set a minimum separation distance (here, equal to sensor_radius; adjust if needed)
         sensor_min_distance = self.sensor_radius
-        
-        # Greedily select sensor positions while enforcing separation.
-        while len(selected) < self.num_sensors and candidates:
-            candidate, score = candidates.pop(0)
-            # Check if candidate is far enough from already selected sensors.
-            if all(np.sqrt((candidate[0] - s[0])**2 + (candidate[1] - s[1])**2) >= sensor_min_distance for s in selected):
-                selected.append(candidate)
-                # Penalize candidates that are too close to this newly selected candidate.
-                new_candidates = []
-                for cand, sc in candidates:
-                    distance = np.sqrt((candidate[0] - cand[0])**2 + (candidate[1] - cand[1])**2)
-                    if distance < sensor_min_distance:
-                        new_candidates.append((cand, 0))
-                    else:
-                        new_candidates.append((cand, sc))
-                candidates = new_candidates
-                candidates.sort(key=lambda x: x[1], reverse=True)
-        
-        return selected
+        min_distance_sq = sensor_min_distance ** 2
+        rr, cc = np.ogrid[:rows, :cols]
+        R = int(sensor_min_distance)
+
+        def select(idx):
+            # Record the cell, then exclude every cell closer than the minimum separation
+            # from further selection (only the surrounding box can be affected).
+            nonlocal num_selected
+            r, c = divmod(int(idx), cols)
+            selected[num_selected] = r, c
+            num_selected += 1
+            r_min, r_max = max(0, r - R), min(rows, r + R + 1)
+            c_min, c_max = max(0, c - R), min(cols, c + R + 1)
+            too_close = (rr[r_min:r_max] - r)**2 + (cc[:, c_min:c_max] - c)**2 < min_distance_sq
+            effective_bp[r_min:r_max, c_min:c_max][too_close] = -np.inf
+
+        # Seed candidates: every cell at least as good as the num_sensors-th best, sorted
+        # best first (ties by position). While a seed is still selectable it is exactly
+        # the cell a full argmax would pick, so most picks avoid scanning the whole map.
+        flat = effective_bp.ravel()
+        k = min(self.num_sensors, flat.size)
+        if k > 0:
+            kth = np.partition(flat, flat.size - k)[flat.size - k]
+            seeds = np.flatnonzero(flat >= kth)
+            for idx in seeds[np.argsort(-flat[seeds], kind="stable")]:
+                if num_selected == self.num_sensors:
+                    break
+                if flat[idx] != -np.inf:
+                    select(idx)
+
+        # Greedily select the highest remaining effective BP cell once the seeds run out.
+        while num_selected < self.num_sensors:
+            idx = np.argmax(flat)
+            if flat[idx] == -np.inf:
+                break  # No valid candidates remaining.
+            select(idx)
+
+        return selected[:num_selected]
@@ -1,9 +1,8 @@
 # Placeholder for ILP-based deployment algorithm
 from .base_deployment import SensorDeployment
-from typing import List, Tuple
 import numpy as np
 
 class ILPDeployment(SensorDeployment):
-    def place_sensors(self, fire_map: np.ndarray, time_step: int, prev_positions=None) -> List[Tuple[int, int]]:
+    def place_sensors(self, fire_map: np.ndarray, bp_map: np.ndarray, time_step: int, prev_positions=None) -> np.ndarray:
         # TODO: Implement ILP sensor placement
-        return []
+        return np.empty((0, 2), dtype=np.int32)
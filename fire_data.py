@@ -1,27 +1,91 @@
 import os
-import pandas as pd
+import json
 import numpy as np
 
 class FireData:
-    def __init__(self, data_dir: str, num_time_steps: int):
+    def __init__(self, data_dir: str, num_time_steps: int, cache_dir: str = ""):
+        """
+        :param data_dir: Directory holding the ForestGridXX.csv fire progression files.
+        :param num_time_steps: Number of time steps to load.
+        :param cache_dir: Directory for a .npy cache of the stacked maps. If empty, no cache
+                          is read or written.
+        """
         self.data_dir = data_dir
         self.num_time_steps = num_time_steps
-        self.fire_maps = []
+        self.cache_dir = cache_dir
+        self.fire_maps = None  # (num_loaded, rows, cols) float32 array
         self._load_data()
 
     def _load_data(self):
         """
         Loads fire progression CSV files, checking for missing files.
+        If cache_dir is set, the stacked maps are cached there as a .npy file and memory-mapped
+        on later runs. A manifest next to the cache records the path, size and mtime of every
+        CSV; the cache is only used if all of them still match exactly.
         """
-        for t in range(self.num_time_steps):
-            filename = os.path.join(self.data_dir, f"ForestGrid{t:02d}.csv")
+        filenames = [os.path.join(self.data_dir, f"ForestGrid{t:02d}.csv") for t in range(self.num_time_steps)]
+        manifest = self._manifest(filenames)
+        if self.cache_dir:
+            cache_file = os.path.join(self.cache_dir, f"fire_maps_{self.num_time_steps:02d}.npy")
+            manifest_file = os.path.join(self.cache_dir, f"fire_maps_{self.num_time_steps:02d}.json")
+            if self._cache_is_fresh(cache_file, manifest_file, manifest):
+                print(f"Loading cached fire maps: {cache_file}")
+                self.fire_maps = np.load(cache_file, mmap_mode="r")
+                return
+
+        fire_maps = None
+        num_loaded = 0
+        for filename in filenames:
             if not os.path.exists(filename):
                 print(f"WARNING: Missing file {filename}, skipping.")
                 continue
             print(f"Loading: {filename}")  # Debugging output
-            df = pd.read_csv(filename, header=None)
-            fire_array = df.to_numpy()
-            self.fire_maps.append(fire_array)
+            fire_array = np.loadtxt(filename, delimiter=",", dtype=np.float32, ndmin=2)
+            if fire_maps is None:
+                fire_maps = np.empty((self.num_time_steps,) + fire_array.shape, dtype=np.float32)
+            fire_maps[num_loaded] = fire_array
+            num_loaded += 1
+        if fire_maps is None:
+            self.fire_maps = np.empty((0, 0, 0), dtype=np.float32)
+            return
+        self.fire_maps = fire_maps[:num_loaded]
+
+        if self.cache_dir:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                np.save(cache_file, self.fire_maps)
+                with open(manifest_file, "w") as f:
+                    json.dump(manifest, f, indent=2)
+            except OSError as e:
+                print(f"WARNING: Could not write fire map cache {cache_file}: {e}")
+
+    @staticmethod
+    def _manifest(filenames) -> list:
+        """
+        [absolute path, size, mtime in ns] of every CSV file, or None for size and mtime if
+        the file is missing.
+        """
+        manifest = []
+        for filename in filenames:
+            try:
+                st = os.stat(filename)
+                manifest.append([os.path.abspath(filename), st.st_size, st.st_mtime_ns])
+            except FileNotFoundError:
+                manifest.append([os.path.abspath(filename), None, None])
+        return manifest
+
+    @staticmethod
+    def _cache_is_fresh(cache_file: str, manifest_file: str, manifest: list) -> bool:
+        """
+        True if cache_file exists and its recorded manifest matches the current CSV files exactly.
+        """
+        if not (os.path.exists(cache_file) and os.path.exists(manifest_file)):
+            return False
+        try:
+            with open(manifest_file) as f:
+                return json.load(f) == manifest
+        except (OSError, ValueError):
+            return False
 
     def get_fire_map(self, time_step: int) -> np.ndarray:
         return self.fire_maps[time_step]
@@ -25,11 +25,12 @@ def main():
     bp_config = config.get("burn_probability", {})
     bp_file = bp_config.get("file", "")
     bp_decay = bp_config.get("decay_factor", 0.9)
+    bp_seed = bp_config.get("seed")
     
     if run_mode.lower() == "simulate":
         data_dir = config["data"]["directory"]
         num_time_steps = config["data"]["num_time_steps"]
-        fire_data = FireData(data_dir, num_time_steps)
+        fire_data = FireData(data_dir, num_time_steps, config["data"].get("cache_directory", ""))
         
         num_sensors = config["deployment"]["num_sensors"]
         sensor_radius = config["deployment"]["sensor_radius"]
@@ -42,20 +43,28 @@ def main():
             epsilon = config["deployment"].get("epsilon", 0.2)
             alpha = config["deployment"].get("alpha", 0.7)
             beta = config["deployment"].get("beta", 0.3)
-            deployment_algo = ReinforcementLearningDeployment(num_sensors, sensor_radius, epsilon, alpha, beta)
+            seed = config["deployment"].get("seed")
+            deployment_algo = ReinforcementLearningDeployment(num_sensors, sensor_radius, epsilon, alpha, beta, seed)
         elif algorithm_choice.lower() == "genetic":
             population_size = config["deployment"].get("population_size", 50)
             num_generations = config["deployment"].get("num_generations", 100)
             mutation_rate = config["deployment"].get("mutation_rate", 0.1)
             alpha = config["deployment"].get("alpha", 0.5)
             beta = config["deployment"].get("beta", 0.5)
-            deployment_algo = GeneticDeployment(num_sensors, sensor_radius, population_size, num_generations, mutation_rate, alpha, beta)
+            num_islands = config["deployment"].get("num_islands", 1)
+            seed = config["deployment"].get("seed")
+            deployment_algo = GeneticDeployment(num_sensors, sensor_radius, population_size, num_generations, mutation_rate, alpha, beta, num_islands, seed)
         else:
             raise ValueError(f"Unknown algorithm specified: {algorithm_choice}")
         
         detection_threshold = config["simulation"]["detection_threshold"]
-        simulation = WildfireSimulation(fire_data, deployment_algo, detection_threshold, exp_name, bp_file, bp_decay)
-        simulation.run_simulation()
+        compress_logs = config["logs"].get("compress", False)
+        simulation = WildfireSimulation(fire_data, deployment_algo, detection_threshold, exp_name, bp_file, bp_decay,
+                                        compress_logs, bp_seed)
+        try:
+            simulation.run_simulation()
+        finally:
+            deployment_algo.close()
         
         coverage_history = simulation.coverage_history
         metrics_obj = SimulationMetrics()
@@ -70,12 +79,13 @@ def main():
                                     simulation.sensor_positions_history,
                                     coverage_history,
                                     simulation.bp_maps,
-                                    exp_name)
+                                    exp_name,
+                                    cache_stack=config["dashboard"].get("cache_stack", False))
     
     elif run_mode.lower() == "visualize_only":
         data_dir = config["data"]["directory"]
         num_time_steps = config["data"]["num_time_steps"]
-        fire_data = FireData(data_dir, num_time_steps)
+        fire_data = FireData(data_dir, num_time_steps, config["data"].get("cache_directory", ""))
         
         timestep_log_dir = os.path.join(config["logs"]["output_directory"], exp_name, "timesteps")
         time_step_logs = load_time_step_logs(timestep_log_dir)
@@ -83,19 +93,24 @@ def main():
         coverage_history = [time_step_logs[t]["coverage"] for t in sorted(time_step_logs.keys())]
         
         bp_map_dir = os.path.join(config["logs"]["output_directory"], exp_name, "bp_maps")
-        bp_maps = []
-        for t in range(num_time_steps):
-            bp_file_path = os.path.join(bp_map_dir, f"bp_map_{t:02d}.csv")
-            if os.path.exists(bp_file_path):
-                bp_map = np.genfromtxt(bp_file_path, delimiter=",")
-                bp_maps.append(bp_map)
+        bp_stack_path = os.path.join(bp_map_dir, "bp_maps.npy")
+        if os.path.exists(bp_stack_path):
+            bp_maps = np.load(bp_stack_path, mmap_mode="r")[:num_time_steps]
+        else:
+            # Older logs hold one bp_map_XX.csv file per time step.
+            bp_maps = []
+            for t in range(num_time_steps):
+                bp_file_path = os.path.join(bp_map_dir, f"bp_map_{t:02d}.csv")
+                if os.path.exists(bp_file_path):
+                    bp_maps.append(np.genfromtxt(bp_file_path, delimiter=","))
         
         if config.get("dashboard", {}).get("enabled", False):
             interactive_dashboard(fire_data.fire_maps,
                                     sensor_positions_history,
                                     coverage_history,
                                     bp_maps,
-                                    exp_name)
+                                    exp_name,
+                                    cache_stack=config["dashboard"].get("cache_stack", False))
     
     else:
         raise ValueError(f"Unknown run_mode specified: {run_mode}")
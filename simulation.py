@@ -1,20 +1,26 @@
 # Module to run the wildfire simulation.
-from typing import List, Tuple
 import numpy as np
 import os
+from typing import Optional
+import gzip
 import json
 import pandas as pd
 from fire_data import FireData
 from algorithms.base_deployment import SensorDeployment
 
 class WildfireSimulation:
+    # Upper bound on burning-cell x sensor distances held in memory at once by _compute_coverage.
+    coverage_chunk_elements = 1 << 22
+
     def __init__(self, 
                  fire_data: FireData, 
                  deployment_algo: SensorDeployment, 
                  detection_threshold: float,
                  experiment_name: str,
                  bp_file: str = "",
-                 bp_decay: float = 0.9):
+                 bp_decay: float = 0.9,
+                 compress_logs: bool = False,
+                 seed: Optional[int] = None):
         """
         :param fire_data: FireData object with fire progression maps.
         :param deployment_algo: A SensorDeployment instance for sensor placement.
@@ -23,6 +29,10 @@ class WildfireSimulation:
                                 Used to create the log folder: logs/<experiment_name>/timesteps.
         :param bp_file: Path to a burn probability CSV. If empty or file not found, a random map is generated.
         :param bp_decay: Decay factor for burn probability over time.
+        :param compress_logs: Write the per-time-step JSON logs gzip-compressed (.json.gz).
+                              Logs are mostly sensor coordinates and compress well.
+        :param seed: Seed for the random burn probability map generated when no CSV is given
+                     (burn_probability.seed in the config; None for an unseeded map).
         """
         self.fire_data = fire_data
         self.deployment_algo = deployment_algo
@@ -30,7 +40,7 @@ class WildfireSimulation:
         self.num_time_steps = fire_data.num_time_steps
         self.sensor_positions_history = []
         self.coverage_history = []
-        self.bp_maps = []  # to store burn probability maps over time
+        self.bp_maps = None  # (num_time_steps + 1, rows, cols) burn probability maps over time
         
         self.experiment_name = experiment_name  
         self.log_dir = os.path.join("logs", self.experiment_name, "timesteps")
@@ -38,6 +48,12 @@ class WildfireSimulation:
         self.bp_log_dir = os.path.join("logs", self.experiment_name, "bp_maps")
         os.makedirs(self.bp_log_dir, exist_ok=True)
         self.bp_decay = bp_decay
+        self.compress_logs = compress_logs
+
+        # Boolean disk of cells within sensor_radius of a sensor, centred in a (2R+1)x(2R+1) box.
+        R = int(self.deployment_algo.sensor_radius)
+        rr, cc = np.ogrid[-R:R + 1, -R:R + 1]
+        self._disk = (rr * rr + cc * cc) <= self.deployment_algo.sensor_radius ** 2
         
         # Initialize burn probability map
         sample_map = self.fire_data.get_fire_map(0)
@@ -46,18 +62,27 @@ class WildfireSimulation:
             if os.path.exists(bp_file):
                 print(f"Loading burn probability CSV from: {bp_file}")
                 # Use whitespace delimiter for the burn probability CSV
-                self.bp_map = pd.read_csv(bp_file, header=None, delim_whitespace=True).to_numpy().astype(float)
+                self.bp_map = pd.read_csv(bp_file, header=None, sep=r"\s+").to_numpy().astype(np.float32)
             else:
                 print(f"Burn probability CSV not found at {bp_file}. Generating random burn probability map.")
-                self.bp_map = np.random.rand(rows, cols)
+                self.bp_map = self._random_bp_map(seed, rows, cols)
         else:
             print("No burn probability CSV provided. Generating random burn probability map.")
-            self.bp_map = np.random.rand(rows, cols)
+            self.bp_map = self._random_bp_map(seed, rows, cols)
 
+        # Preallocate the BP history; slot 0 holds the initial map, slot t+1 the map after step t.
+        self.bp_maps = np.empty((self.num_time_steps + 1,) + self.bp_map.shape, dtype=np.float32)
+        self.bp_maps[0] = self.bp_map
 
-        
-        # Save the initial BP map
-        self.bp_maps.append(self.bp_map.copy())
+    @staticmethod
+    def _random_bp_map(seed: Optional[int], rows: int, cols: int) -> np.ndarray:
+        """
+        Uniform random float32 burn probability map. It is drawn from a child of
+        SeedSequence(seed) rather than from default_rng(seed) itself, so it never shares a
+        stream with a deployment algorithm seeded with the same integer.
+        """
+        bp_seed = np.random.SeedSequence(seed).spawn(1)[0]
+        return np.random.default_rng(bp_seed).random((rows, cols), dtype=np.float32)
 
     def run_simulation(self):
         prev_sensor_positions = None
@@ -84,9 +109,8 @@ class WildfireSimulation:
                 if fire_map[r, c] >= self.detection_threshold:
                     self._update_bp_map_with_sensor(r, c)
             
-            # Save the updated BP map for this time step.
-            self.bp_maps.append(self.bp_map.copy())
-            self._save_bp_map(t, self.bp_map)
+            # Record the updated BP map for this time step.
+            self.bp_maps[t + 1] = self.bp_map
             
             # Compute coverage.
             coverage = self._compute_coverage(fire_map, sensor_positions)
@@ -96,51 +120,66 @@ class WildfireSimulation:
             # Log the current time step's sensor positions and coverage.
             self.log_time_step(t, sensor_positions, coverage)
 
+        self._save_bp_maps()
+
     def _update_bp_map_with_sensor(self, r_center: int, c_center: int):
         """
         Update the burn probability map: set cells within sensor_radius to 1.0.
         """
         rows, cols = self.bp_map.shape
-        r_min = max(0, r_center - int(self.deployment_algo.sensor_radius))
-        r_max = min(rows, r_center + int(self.deployment_algo.sensor_radius) + 1)
-        c_min = max(0, c_center - int(self.deployment_algo.sensor_radius))
-        c_max = min(cols, c_center + int(self.deployment_algo.sensor_radius) + 1)
-        for r in range(r_min, r_max):
-            for c in range(c_min, c_max):
-                if np.sqrt((r - r_center)**2 + (c - c_center)**2) <= self.deployment_algo.sensor_radius:
-                    self.bp_map[r, c] = 1.0
+        R = int(self.deployment_algo.sensor_radius)
+        r_min = max(0, r_center - R)
+        r_max = min(rows, r_center + R + 1)
+        c_min = max(0, c_center - R)
+        c_max = min(cols, c_center + R + 1)
+        # Crop the precomputed disk to match the clipping at the map edges.
+        disk = self._disk[r_min - (r_center - R):r_max - (r_center - R),
+                          c_min - (c_center - R):c_max - (c_center - R)]
+        self.bp_map[r_min:r_max, c_min:c_max][disk] = 1.0
 
-    def _compute_coverage(self, fire_map: np.ndarray, sensor_positions: List[Tuple[int, int]]) -> float:
-        burning_cells = [(r, c) for r in range(fire_map.shape[0])
-                         for c in range(fire_map.shape[1]) if fire_map[r, c] >= self.detection_threshold]
-        if not burning_cells:
+    def _compute_coverage(self, fire_map: np.ndarray, sensor_positions: np.ndarray) -> float:
+        burning = np.argwhere(fire_map >= self.detection_threshold)
+        if len(burning) == 0:
             return 1.0
-        detected = 0
+        sensors = np.asarray(sensor_positions).reshape(-1, 2)
         radius_sq = self.deployment_algo.sensor_radius ** 2
-        for r_fire, c_fire in burning_cells:
-            for r_sens, c_sens in sensor_positions:
-                if (r_fire - r_sens)**2 + (c_fire - c_sens)**2 <= radius_sq:
-                    detected += 1
-                    break
-        return detected / len(burning_cells)
+        # Squared distance from each burning cell to each sensor, chunked along the
+        # burning cells so the (cells, sensors) matrix stays bounded on large fires.
+        chunk = max(1, self.coverage_chunk_elements // max(1, len(sensors)))
+        detected = 0
+        for start in range(0, len(burning), chunk):
+            cells = burning[start:start + chunk]
+            d2 = ((cells[:, None, :] - sensors[None, :, :])**2).sum(-1)
+            detected += int((d2 <= radius_sq).any(axis=1).sum())
+        return detected / len(burning)
     
-    def log_time_step(self, time_step: int, sensor_positions: List[Tuple[int, int]], coverage: float):
+    def log_time_step(self, time_step: int, sensor_positions: np.ndarray, coverage: float):
         """
         Logs sensor positions and coverage for a given time step to a JSON file.
-        Files are saved under logs/<experiment_name>/timesteps.
+        Files are saved under logs/<experiment_name>/timesteps, gzip-compressed if compress_logs is set.
         """
         log_data = {
             "time_step": time_step,
-            "sensor_positions": sensor_positions,
+            "sensor_positions": np.asarray(sensor_positions).tolist(),
             "coverage": coverage
         }
         log_file = os.path.join(self.log_dir, f"time_step_{time_step:02d}.json")
-        with open(log_file, "w") as f:
-            json.dump(log_data, f, indent=2)
+        if self.compress_logs:
+            log_file, stale_file = log_file + ".gz", log_file
+            with gzip.open(log_file, "wt") as f:
+                json.dump(log_data, f)
+        else:
+            stale_file = log_file + ".gz"
+            with open(log_file, "w") as f:
+                json.dump(log_data, f, indent=2)
+        # Drop this step's log in the other format, left over from a run with compress_logs toggled.
+        if os.path.exists(stale_file):
+            os.remove(stale_file)
     
-    def _save_bp_map(self, time_step: int, bp_map: np.ndarray):
+    def _save_bp_maps(self):
         """
-        Save the burn probability map as a CSV file.
+        Save the per-time-step burn probability maps as a single (num_time_steps, rows, cols)
+        .npy file. Entry t is the map after time step t, the initial map is not included.
         """
-        bp_file = os.path.join(self.bp_log_dir, f"bp_map_{time_step:02d}.csv")
-        np.savetxt(bp_file, bp_map, delimiter=",")
+        bp_file = os.path.join(self.bp_log_dir, "bp_maps.npy")
+        np.save(bp_file, self.bp_maps[1:])
@@ -1,98 +1,287 @@
 import os
+import re
+import gzip
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.animation as animation
-from matplotlib.widgets import Slider, Button
 
-def show_fire_progression(fire_maps):
+# matplotlib is imported inside the functions that draw, so loading the logs (or importing
+# this module from a headless tool) does not pay for pyplot, backend and widget setup.
+
+# Per-time-step log files written by WildfireSimulation.log_time_step.
+_TIME_STEP_LOG = re.compile(r"time_step_(\d+)\.json(\.gz)?$")
+
+try:
+    import orjson
+except ImportError:  # optional; the standard json parser is used instead
+    orjson = None
+
+def _frame_label(ax):
+    """
+    Creates an animated text artist in the top-left corner of ax for the time step label.
+    It lives inside the axes so blitting the axes region also repaints it.
+    """
+    return ax.text(0.02, 0.98, "", transform=ax.transAxes, va="top", ha="left",
+                   bbox=dict(facecolor="white", alpha=0.7, edgecolor="none"), animated=True)
+
+def _stack_maps(maps):
+    """
+    Stacks a sequence of 2D maps into one C-contiguous float32 (T, rows, cols) array, so
+    each frame is a zero-copy slice. Stacked float32 arrays are passed through.
+    """
+    if isinstance(maps, np.ndarray) and maps.ndim == 3:
+        return np.ascontiguousarray(maps, dtype=np.float32)
+    return np.ascontiguousarray(np.stack(maps), dtype=np.float32)
+
+def _quantize_probabilities(cube):
+    """
+    Quantizes probabilities in [0, 1] to uint8 levels 0-255 for display with vmin=0, vmax=255.
+    """
+    return np.rint(np.clip(cube, 0, 1) * 255).astype(np.uint8)
+
+@lru_cache(maxsize=None)
+def _colormap_lut(name):
+    """
+    Returns the 256-entry uint8 RGBA lookup table of the named colormap, built once.
+    """
+    import matplotlib
+    return matplotlib.colormaps[name].resampled(256)(np.arange(256), bytes=True)
+
+def _colorize(arr, lut, vmin=None, vmax=None):
+    """
+    Maps arr to uint8 RGBA with a single gather from lut. uint8 input is used as the
+    table index directly; other input is scaled from [vmin, vmax] onto the 256 bins the
+    same way a Normalize + Colormap call would.
+    """
+    if arr.dtype == np.uint8:
+        return lut[arr]
+    scale = np.float32(256 / (vmax - vmin)) if vmax > vmin else np.float32(0)
+    idx = np.clip((arr - np.float32(vmin)) * scale, 0, 255).astype(np.uint8)
+    return lut[idx]
+
+def _sensor_offsets(sensor_positions_history):
+    """
+    Packs every time step's (row, col) sensor positions into one padded (T, Nmax, 2) array
+    of (x, y) scatter offsets, once, so frame updates do no per-call conversion.
+    Returns (sensor_xy, counts); the offsets of step t are the view sensor_xy[t, :counts[t]].
+    Coordinates are stored as int16 when they fit, which halves the memory of int32.
+    """
+    if isinstance(sensor_positions_history, np.ndarray) and sensor_positions_history.ndim == 3:
+        # Same sensor count at every step: a single conversion, no per-step work.
+        steps = sensor_positions_history
+        counts = np.full(len(steps), steps.shape[1], dtype=np.int32)
+    else:
+        steps = [np.asarray(p).reshape(-1, 2) for p in sensor_positions_history]
+        counts = np.array([len(p) for p in steps], dtype=np.int32)
+    max_sensors = int(counts.max()) if len(counts) else 0
+    max_coord = max((int(p.max()) for p in steps if len(p)), default=0)
+    dtype = np.int16 if max_coord <= np.iinfo(np.int16).max else np.int32
+
+    sensor_xy = np.full((len(counts), max_sensors, 2), -1, dtype=dtype)
+    if isinstance(steps, np.ndarray):
+        sensor_xy[...] = steps[..., ::-1]
+    else:
+        # Fill the padded buffer directly, swapping (row, col) to (x, y) on the way in.
+        for t, p in enumerate(steps):
+            sensor_xy[t, :len(p)] = p[:, ::-1]
+    return sensor_xy, counts
+
+def show_fire_progression(fire_maps, stride=1, interval=1000):
     """
     Animates the fire progression over time.
     
     :param fire_maps: List of numpy arrays representing fire maps for each time step.
+    :param stride: Show only every stride-th time step, for responsiveness on long runs.
+    :param interval: Delay between frames in milliseconds.
     """
+    import matplotlib.pyplot as plt
+    import matplotlib.animation as animation
+    fire_cube = _stack_maps(fire_maps)
     fig, ax = plt.subplots(figsize=(8, 6))
+    ax.set_title("Fire Progression")
+    ax.axis("off")
+    # Create the image and label once; each frame only swaps their data.
+    im = ax.imshow(fire_cube[0], cmap="YlOrRd", alpha=0.8, vmin=fire_cube.min(), vmax=fire_cube.max(),
+                   interpolation="nearest", animated=True)
+    label = _frame_label(ax)
     
     def update(frame):
-        ax.clear()
-        ax.imshow(fire_maps[frame], cmap="YlOrRd", alpha=0.8)
-        ax.set_title(f"Fire Progression - Time Step {frame}")
-        ax.axis("off")
+        im.set_data(fire_cube[frame])
+        label.set_text(f"Time Step {frame}")
+        return im, label
     
-    ani = animation.FuncAnimation(fig, update, frames=len(fire_maps), interval=1000, repeat=True)
+    ani = animation.FuncAnimation(fig, update, frames=range(0, len(fire_cube), stride),
+                                  interval=interval, repeat=True, blit=True, cache_frame_data=False)
     plt.show()
 
-def show_sensor_deployment(sensor_positions_history, fire_maps):
+def export_fire_progression(fire_maps, path, fps=1, dpi=72):
+    """
+    Renders the fire progression straight to a video file, without a GUI window or
+    FuncAnimation. Frames are drawn on an Agg canvas and piped to the encoder one by one.
+    Files ending in .gif are written with Pillow, anything else with ffmpeg.
+
+    :param fire_maps: List of numpy arrays representing fire maps for each time step.
+    :param path: Output file path (e.g. fire_progression.mp4 or fire_progression.gif).
+    :param fps: Frames (time steps) per second in the output.
+    :param dpi: Resolution of the rendered frames.
+    """
+    import matplotlib.animation as animation
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    fire_cube = _stack_maps(fire_maps)
+    fig = Figure(figsize=(8, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.set_title("Fire Progression")
+    ax.axis("off")
+    im = ax.imshow(fire_cube[0], cmap="YlOrRd", alpha=0.8, vmin=fire_cube.min(), vmax=fire_cube.max(),
+                   interpolation="nearest")
+    label = _frame_label(ax)
+    label.set_animated(False)  # every frame is a full draw here, nothing is blitted
+
+    if path.lower().endswith(".gif"):
+        writer = animation.PillowWriter(fps=fps)
+    else:
+        writer = animation.FFMpegWriter(fps=fps)
+    with writer.saving(fig, path, dpi=dpi):
+        for t in range(len(fire_cube)):
+            im.set_data(fire_cube[t])
+            label.set_text(f"Time Step {t}")
+            writer.grab_frame()
+
+def show_sensor_deployment(sensor_positions_history, fire_maps, stride=1, interval=1000):
     """
     Animates the sensor deployment over the fire maps.
     
     :param sensor_positions_history: List of lists containing sensor (row, col) positions for each time step.
     :param fire_maps: List of numpy arrays representing fire maps for each time step.
+    :param stride: Show only every stride-th time step, for responsiveness on long runs.
+    :param interval: Delay between frames in milliseconds.
     """
+    import matplotlib.pyplot as plt
+    import matplotlib.animation as animation
+    fire_cube = _stack_maps(fire_maps)
+    sensor_xy, counts = _sensor_offsets(sensor_positions_history)
     fig, ax = plt.subplots(figsize=(8, 6))
+    ax.set_title("Sensor Deployment")
+    ax.axis("off")
+    im = ax.imshow(fire_cube[0], cmap="YlOrRd", alpha=0.8, vmin=fire_cube.min(), vmax=fire_cube.max(),
+                   interpolation="nearest", animated=True)
+    label = _frame_label(ax)
+    # A single scatter whose offsets are moved each frame.
+    sensor_scatter = ax.scatter([], [], c="blue", s=100, marker="o", animated=True)
     
     def update(frame):
-        ax.clear()
-        ax.imshow(fire_maps[frame], cmap="YlOrRd", alpha=0.8)
-        sensor_positions = sensor_positions_history[frame]
-        if sensor_positions:
-            sensor_positions = np.array(sensor_positions)
-            ax.scatter(sensor_positions[:, 1], sensor_positions[:, 0], c="blue", s=100, marker="o")
-        ax.set_title(f"Time Step {frame} - Sensor Deployment")
-        ax.axis("off")
+        im.set_data(fire_cube[frame])
+        sensor_scatter.set_offsets(sensor_xy[frame, :counts[frame]])
+        label.set_text(f"Time Step {frame}")
+        return im, sensor_scatter, label
     
-    ani = animation.FuncAnimation(fig, update, frames=len(fire_maps), interval=1000, repeat=True)
+    ani = animation.FuncAnimation(fig, update, frames=range(0, len(fire_cube), stride),
+                                  interval=interval, repeat=True, blit=True, cache_frame_data=False)
     plt.show()
 
-def show_metrics(coverage_history):
+def show_metrics(coverage_history, ax=None):
     """
     Plots the coverage metric over time.
     
     :param coverage_history: List of coverage values (floats) for each time step.
+    :param ax: Axes to plot into. If None, a new figure is created and shown; with the
+               headless Agg backend it is created off-screen instead and not shown.
+    :return: The axes holding the plot.
     """
-    fig, ax = plt.subplots(figsize=(8, 4))
-    ax.plot(range(len(coverage_history)), coverage_history, marker="o", linestyle="-", color="green")
+    created = ax is None
+    if created:
+        import matplotlib
+        headless = matplotlib.get_backend().lower() == "agg"
+        if headless:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+            fig = Figure(figsize=(8, 4))
+            FigureCanvasAgg(fig)
+            ax = fig.add_subplot()
+        else:
+            import matplotlib.pyplot as plt
+            fig, ax = plt.subplots(figsize=(8, 4))
+    coverage = np.asarray(coverage_history, dtype=np.float32)
+    steps = np.arange(len(coverage))
+    # A plain polyline plus one scatter collection for the markers, rather than a Line2D
+    # that strokes a marker per point.
+    ax.plot(steps, coverage, linestyle="-", color="green")
+    ax.scatter(steps, coverage, s=20, c="green")
     ax.set_xlabel("Time Step")
     ax.set_ylabel("Coverage")
     ax.set_title("Coverage Metric Over Time")
     ax.grid(True)
     ax.set_ylim(0, 1)
-    plt.show()
+    if created and not headless:
+        plt.show()
+    return ax
 
-def show_bp_maps(bp_maps):
+def show_bp_maps(bp_maps, stride=1, interval=1000):
     """
     Animates the burn probability maps over time.
     
     :param bp_maps: List of numpy arrays representing BP maps for each time step.
+    :param stride: Show only every stride-th time step, for responsiveness on long runs.
+    :param interval: Delay between frames in milliseconds.
     """
+    import matplotlib.pyplot as plt
+    import matplotlib.animation as animation
+    bp_cube = _quantize_probabilities(_stack_maps(bp_maps))
     fig, ax = plt.subplots(figsize=(8, 6))
+    ax.set_title("Burn Probability Map")
+    ax.axis("off")
+    im = ax.imshow(bp_cube[0], cmap="hot", vmin=0, vmax=255, interpolation="nearest", animated=True)
+    label = _frame_label(ax)
     
     def update(frame):
-        ax.clear()
-        ax.imshow(bp_maps[frame], cmap="hot", vmin=0, vmax=1)
-        ax.set_title(f"Burn Probability Map - Time Step {frame}")
-        ax.axis("off")
+        im.set_data(bp_cube[frame])
+        label.set_text(f"Time Step {frame}")
+        return im, label
     
-    ani = animation.FuncAnimation(fig, update, frames=len(bp_maps), interval=1000, repeat=True)
+    ani = animation.FuncAnimation(fig, update, frames=range(0, len(bp_cube), stride),
+                                  interval=interval, repeat=True, blit=True, cache_frame_data=False)
     plt.show()
 
-def load_time_step_logs(logs_dir):
+def _read_json(path):
+    """
+    Parses one JSON file, gzip-compressed if its name ends in .gz, using orjson when it
+    is installed.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    if path.endswith(".gz"):
+        raw = gzip.decompress(raw)
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+def load_time_step_logs(logs_dir, max_workers=8):
     """
     Loads all JSON log files from the specified logs directory.
+    Files are read and parsed on a thread pool so their I/O overlaps. Both plain
+    time_step_XX.json and gzip-compressed time_step_XX.json.gz logs are accepted.
     
     :param logs_dir: Directory containing time step JSON log files.
-    :return: Dictionary mapping time step (int) to log data.
+    :param max_workers: Number of threads reading log files.
+    :return: Dictionary mapping time step (int) to log data, in time step order.
     """
-    time_step_logs = {}
-    for filename in sorted(os.listdir(logs_dir)):
-        if filename.startswith("time_step_") and filename.endswith(".json"):
-            filepath = os.path.join(logs_dir, filename)
-            with open(filepath, "r") as f:
-                data = json.load(f)
-            time_step_logs[data["time_step"]] = data
-    return time_step_logs
+    # The time step is taken from the file name, so the logs sort numerically. If a step
+    # has both a .json and a .json.gz log, the most recently written one is used.
+    newest = {}
+    for entry in os.scandir(logs_dir):
+        match = _TIME_STEP_LOG.match(entry.name)
+        if match:
+            t = int(match.group(1))
+            if t not in newest or entry.stat().st_mtime_ns > newest[t].stat().st_mtime_ns:
+                newest[t] = entry
+    entries = sorted((t, entry.path) for t, entry in newest.items())
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        logs = executor.map(_read_json, (path for _, path in entries))
+        return {t: data for (t, _), data in zip(entries, logs)}
 
-def interactive_dashboard(fire_maps, sensor_positions_history, coverage_history, bp_maps,experiment_name):
+def interactive_dashboard(fire_maps, sensor_positions_history, coverage_history, bp_maps, experiment_name,
+                          cache_stack=False):
     """
     Creates an interactive dashboard with three panels:
       1. Fire progression with sensor deployment (current time step).
@@ -105,69 +294,163 @@ def interactive_dashboard(fire_maps, sensor_positions_history, coverage_history,
     :param sensor_positions_history: List of lists of sensor (row, col) positions per time step.
     :param coverage_history: List of coverage values (floats) for each time step.
     :param bp_maps: List of numpy arrays representing burn probability maps per time step.
+    :param experiment_name: Name of the experiment, shown in the figure title.
+    :param cache_stack: If True, colormap every frame to RGBA once at startup so the slider
+                        only swaps image data. Costs 2 * T * rows * cols * 4 bytes; otherwise
+                        frames are colormapped on demand and the most recent 64 are cached.
     """
-    num_time_steps = len(fire_maps)
+    import matplotlib.pyplot as plt
+    from matplotlib.transforms import Bbox
+    from matplotlib.widgets import Slider, Button
+    # Stack the maps and convert the sensor positions once, up front.
+    fire_cube = _stack_maps(fire_maps)
+    bp_cube = _quantize_probabilities(_stack_maps(bp_maps))
+    sensor_xy, counts = _sensor_offsets(sensor_positions_history)
+    num_time_steps = len(fire_cube)
     current_time = 0
 
-    # Create a figure with three subplots side by side.
-    fig, axs = plt.subplots(1, 3, figsize=(18, 6))
+    fire_lut, bp_lut = _colormap_lut("YlOrRd"), _colormap_lut("hot")
+    fire_min, fire_max = fire_cube.min(), fire_cube.max()
+    # bp_cube holds uint8 levels, which index the colormap lookup table directly.
+    if cache_stack:
+        # Colormap the whole (T, rows, cols) cubes in one pass each; lookups become indexing.
+        fire_stack = _colorize(fire_cube, fire_lut, fire_min, fire_max)
+        bp_stack = _colorize(bp_cube, bp_lut)
+
+        def render(t):
+            return fire_stack[t], bp_stack[t]
+    else:
+        # Colormapped RGBA frames are memoized per time step, so scrubbing back and forth over
+        # steps already shown skips the colormap lookup.
+        @lru_cache(maxsize=64)
+        def render(t):
+            return _colorize(fire_cube[t], fire_lut, fire_min, fire_max), _colorize(bp_cube[t], bp_lut)
+
+    # Create a figure with three subplots side by side. The DPI is fixed and per-step text
+    # lives inside the axes, so frame updates never resize or re-layout the panels.
+    fig, axs = plt.subplots(1, 3, figsize=(18, 6), dpi=72)
     fig.suptitle(f"Experiment: {experiment_name}", fontsize=16)  # Now experiment_name is defined.
     plt.subplots_adjust(bottom=0.25)
 
     # Panel 1: Fire progression with sensor deployment.
+    # Artists that change with the time step are animated: they are left out of full
+    # redraws and blitted over a cached background instead.
     ax1 = axs[0]
-    fire_im = ax1.imshow(fire_maps[current_time], cmap="YlOrRd", alpha=0.8)
-    sensor_scatter = None
-    if sensor_positions_history[current_time]:
-        sensor_positions = np.array(sensor_positions_history[current_time])
-        sensor_scatter = ax1.scatter(sensor_positions[:, 1], sensor_positions[:, 0], c="blue", s=100, marker="o")
-    ax1.set_title(f"Fire & Sensors - Time Step {current_time}")
+    fire_rgba, bp_rgba = render(current_time)
+    fire_im = ax1.imshow(fire_rgba, alpha=0.8, interpolation="nearest", animated=True)
+    sensor_scatter = ax1.scatter([], [], c="blue", s=100, marker="o", animated=True)
+    fire_label = _frame_label(ax1)
+    ax1.set_title("Fire & Sensors")
     ax1.axis("off")
 
     # Panel 2: Coverage metric over time.
-    ax2 = axs[1]
-    ax2.plot(range(num_time_steps), coverage_history, marker="o", linestyle="-", color="green")
-    vline = ax2.axvline(x=current_time, color="red", linestyle="--")
-    ax2.set_xlabel("Time Step")
-    ax2.set_ylabel("Coverage")
+    ax2 = show_metrics(coverage_history, ax=axs[1])
     ax2.set_title("Coverage Over Time")
-    ax2.grid(True)
-    ax2.set_ylim(0, 1)
+    vline = ax2.axvline(x=current_time, color="red", linestyle="--", animated=True)
+    # Panel 2 limits never change after setup; set them once, with half a step of margin so
+    # the first and last markers are not clipped.
+    ax2.set_xlim(-0.5, num_time_steps - 0.5)
 
     # Panel 3: Burn probability map.
     ax3 = axs[2]
-    bp_im = ax3.imshow(bp_maps[current_time], cmap="hot", vmin=0, vmax=1)
-    ax3.set_title(f"Burn Probability - Time Step {current_time}")
+    bp_im = ax3.imshow(bp_rgba, interpolation="nearest", animated=True)
+    bp_label = _frame_label(ax3)
+    ax3.set_title("Burn Probability")
     ax3.axis("off")
 
-    # Create a slider for time step selection.
+    # Create a slider for time step selection. The slider is blitted along with the
+    # panels, so it must not trigger a full redraw itself on every change.
     ax_slider = plt.axes([0.25, 0.1, 0.5, 0.03])
-    time_slider = Slider(ax_slider, 'Time Step', 0, num_time_steps - 1, valinit=current_time, valfmt='%0.0f')
+    time_slider = Slider(ax_slider, 'Time Step', 0, num_time_steps - 1, valinit=current_time, valfmt='%0.0f',
+                         valstep=1)
+    time_slider.drawon = False
+    ax_slider.set_animated(True)
 
-    def update(val):
-        nonlocal sensor_scatter
-        t = int(time_slider.val)
+    animated = {ax1: (fire_im, sensor_scatter, fire_label), ax2: (vline,), ax3: (bp_im, bp_label)}
+    backgrounds = {}
+
+    def slider_region():
+        # Full-width strip around the slider: its label and value text sit outside its axes.
+        bbox = ax_slider.bbox
+        return Bbox([[fig.bbox.x0, bbox.y0 - 10], [fig.bbox.x1, bbox.y1 + 10]])
+
+    def draw_animated():
+        for ax, artists in animated.items():
+            for artist in artists:
+                ax.draw_artist(artist)
+        fig.draw_artist(ax_slider)
+
+    def on_draw(event):
+        # Cache the static background of every panel after each full redraw.
+        for ax in animated:
+            backgrounds[ax] = fig.canvas.copy_from_bbox(ax.bbox)
+        backgrounds[ax_slider] = fig.canvas.copy_from_bbox(slider_region())
+        draw_animated()
+
+    fig.canvas.mpl_connect("draw_event", on_draw)
+
+    def set_time_step(t):
         # Update Panel 1: Fire map and sensor positions.
-        fire_im.set_data(fire_maps[t])
-        if sensor_scatter is not None:
-            sensor_scatter.remove()
-        if sensor_positions_history[t]:
-            sensor_positions = np.array(sensor_positions_history[t])
-            sensor_scatter = ax1.scatter(sensor_positions[:, 1], sensor_positions[:, 0], c="blue", s=100, marker="o")
-        ax1.set_title(f"Fire & Sensors - Time Step {t}")
+        fire_rgba, bp_rgba = render(t)
+        fire_im.set_data(fire_rgba)
+        sensor_scatter.set_offsets(sensor_xy[t, :counts[t]])
+        fire_label.set_text(f"Time Step {t}")
 
         # Update Panel 2: Move vertical line.
         vline.set_xdata([t, t])
-        ax2.relim()
-        ax2.autoscale_view()
 
         # Update Panel 3: Burn probability map.
-        bp_im.set_data(bp_maps[t])
-        ax3.set_title(f"Burn Probability - Time Step {t}")
-        fig.canvas.draw_idle()
+        bp_im.set_data(bp_rgba)
+        bp_label.set_text(f"Time Step {t}")
+
+    set_time_step(current_time)
+    last_t = current_time
+
+    def redraw():
+        if not backgrounds:
+            fig.canvas.draw_idle()  # Nothing cached yet; the first full draw paints everything.
+            return
+        # Restore each cached background, draw the changed artists and blit only those regions.
+        for ax in animated:
+            fig.canvas.restore_region(backgrounds[ax])
+        fig.canvas.restore_region(backgrounds[ax_slider])
+        draw_animated()
+        for ax in animated:
+            fig.canvas.blit(ax.bbox)
+        fig.canvas.blit(slider_region())
+
+    def show_last_step():
+        set_time_step(last_t)
+        redraw()
+
+    # Dragging the slider fires a burst of change events; restarting a short single-shot
+    # timer on each one coalesces the burst, so only the step it settles on is rendered.
+    redraw_timer = fig.canvas.new_timer(interval=16)
+    redraw_timer.single_shot = True
+    redraw_timer.add_callback(show_last_step)
+
+    def update(val):
+        nonlocal last_t
+        t = int(time_slider.val)
+        if t == last_t:
+            return
+        last_t = t
+        redraw_timer.stop()
+        redraw_timer.start()
 
     time_slider.on_changed(update)
 
+    # Stride slider: dragging the time slider and the Previous/Next buttons move by this
+    # many time steps, so long runs can be skimmed without rendering every step.
+    ax_stride = plt.axes([0.25, 0.15, 0.5, 0.03])
+    stride_slider = Slider(ax_stride, 'Stride', 1, max(num_time_steps - 1, 2), valinit=1, valfmt='%0.0f',
+                           valstep=1)
+
+    def set_stride(val):
+        time_slider.valstep = int(val)
+
+    stride_slider.on_changed(set_stride)
+
     # Create "Previous" and "Next" buttons.
     axprev = plt.axes([0.1, 0.025, 0.1, 0.04])
     axnext = plt.axes([0.8, 0.025, 0.1, 0.04])
@@ -177,12 +460,12 @@ def interactive_dashboard(fire_maps, sensor_positions_history, coverage_history,
     def prev(event):
         t = int(time_slider.val)
         if t > 0:
-            time_slider.set_val(t - 1)
+            time_slider.set_val(max(t - int(stride_slider.val), 0))
 
     def next(event):
         t = int(time_slider.val)
         if t < num_time_steps - 1:
-            time_slider.set_val(t + 1)
+            time_slider.set_val(min(t + int(stride_slider.val), num_time_steps - 1))
 
     bprev.on_clicked(prev)
     bnext.on_clicked(next)